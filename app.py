@@ -5,74 +5,364 @@ Real-time location tracking with live updates
 Built with ❤️ by Sandeep Gaddam
 """
 
-from flask import Flask, render_template, request, jsonify, abort
+from flask import Flask, render_template, request, abort
+from flask.json.provider import JSONProvider
 from flask_socketio import SocketIO, emit
+from collections import Counter, deque
 from datetime import datetime
-import json
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import msgpack
+import orjson
 import os
 from pathlib import Path
+import queue
+import sys
+import threading
+import time
 import uuid
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (request.get_json, tojson, etc.)"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = os.urandom(24)
-app.config['JSON_AS_ASCII'] = False
 
 # Initialize Socket.IO for real-time updates
 socketio = SocketIO(app, cors_allowed_origins="*")
 
+# Console logging goes through a queue so request threads never block on stdout
+# (set UNQTRAKER_LOG_LEVEL=WARNING to silence per-location output in production)
+logger = logging.getLogger('unqtraker')
+logger.setLevel(os.environ.get('UNQTRAKER_LOG_LEVEL', 'INFO').upper())
+logger.propagate = False
+_log_queue = queue.Queue()
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Storage directory for location data
 DATA_DIR = Path('data')
 DATA_DIR.mkdir(exist_ok=True)
 LOCATIONS_FILE = DATA_DIR / 'locations.json'
+LOCATIONS_LOG = DATA_DIR / 'locations.msgpack'
 SESSIONS_FILE = DATA_DIR / 'sessions.json'
+SESSIONS_LOG = DATA_DIR / 'sessions.msgpack'
 
-def load_locations():
-    """Load location data from JSON file"""
+# Keep only last 500 locations for comprehensive history
+MAX_LOCATIONS = 500
+
+# Rewrite an append-only log once it holds this many records
+COMPACT_THRESHOLD = MAX_LOCATIONS * 10
+
+def _encode_record(record):
+    """Encode one location or (session_id, session) upsert as a msgpack record"""
+    return msgpack.packb(record, use_bin_type=True)
+
+def _read_log(path):
+    """Yield every decodable record from a msgpack log"""
+    size = path.stat().st_size
+    end = 0
+    with open(path, 'rb') as f:
+        unpacker = msgpack.Unpacker(f, raw=False)
+        try:
+            for record in unpacker:
+                end = unpacker.tell()
+                yield record
+        except ValueError:
+            # Stop at a corrupt record; a truncated tail just ends iteration
+            pass
+    if end < size:
+        logger.warning("⚠️ Stopped reading %s at byte %d of %d; the rest is corrupt or partially written", path, end, size)
+
+def _read_locations_file():
+    """Read location data from the msgpack log (or legacy JSON file)"""
+    if LOCATIONS_LOG.exists():
+        return list(_read_log(LOCATIONS_LOG))
     if LOCATIONS_FILE.exists():
         try:
-            with open(LOCATIONS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return orjson.loads(LOCATIONS_FILE.read_bytes())
         except:
             return []
     return []
 
-def save_location(data):
-    """Save location data to JSON file"""
-    locations = load_locations()
-    locations.append(data)
-    
-    # Keep only last 500 locations for comprehensive history
-    if len(locations) > 500:
-        locations = locations[-500:]
-    
-    with open(LOCATIONS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(locations, f, indent=2, ensure_ascii=False)
-    
-    return data
-
-def load_sessions():
-    """Load active sessions"""
+def _read_sessions_file():
+    """Replay session upserts from the msgpack log (or read legacy JSON file)"""
+    if SESSIONS_LOG.exists():
+        sessions = {}
+        for session_id, data in _read_log(SESSIONS_LOG):
+            sessions[session_id] = data
+        return sessions
     if SESSIONS_FILE.exists():
         try:
-            with open(SESSIONS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return orjson.loads(SESSIONS_FILE.read_bytes())
         except:
             return {}
     return {}
 
-def save_session(session_id, data):
-    """Save session information"""
-    sessions = load_sessions()
-    sessions[session_id] = data
+def _location_ip(location):
+    """Return the client IP recorded with a location, if any"""
+    return (location.get('device_info') or {}).get('ip_address') or None
+
+def _discount(counter, key):
+    """Decrement a Counter entry, dropping it once it reaches zero"""
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
+def _compact_location(location, previous_device_info):
+    """Reuse the previous device_info dict when the new one is unchanged"""
+    device_info = location.get('device_info')
+    if isinstance(device_info, dict) and device_info == previous_device_info:
+        location['device_info'] = previous_device_info
+    return location
+
+def _compact_locations(locations, sessions):
+    """Compact freshly loaded records, then point sessions at their latest device_info"""
+    last_device_info = {}
+    for location in locations:
+        # Decoded msgpack maps carry their own copy of every key
+        location = {sys.intern(k): v for k, v in location.items()}
+        if isinstance(location.get('device_info'), dict):
+            location['device_info'] = {sys.intern(k): v for k, v in location['device_info'].items()}
+        session_id = location.get('session_id')
+        location = _compact_location(location, last_device_info.get(session_id))
+        last_device_info[session_id] = location.get('device_info')
+        yield location
     
-    with open(SESSIONS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(sessions, f, indent=2, ensure_ascii=False)
+    for session_id, session in sessions.items():
+        if isinstance(session.get('device_info'), dict) and session['device_info'] == last_device_info.get(session_id):
+            session['device_info'] = last_device_info[session_id]
+
+def _write_log(path, records):
+    """Atomically replace a log with the given encoded records"""
+    tmp_file = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(b''.join(records))
+    os.replace(tmp_file, path)
+
+# In-memory store is the source of truth; disk is only touched to persist
+_SESSIONS = _read_sessions_file()
+_LOCATIONS = deque(maxlen=MAX_LOCATIONS)
+_LOCATIONS.extend(_compact_locations(_read_locations_file()[-MAX_LOCATIONS:], _SESSIONS))
+_SESSION_COUNTS = Counter(loc.get('session_id') for loc in _LOCATIONS)
+_IP_COUNTS = Counter(_location_ip(loc) for loc in _LOCATIONS)
+_IP_COUNTS.pop(None, None)
+_LIVE_SESSIONS = set(sid for sid, s in _SESSIONS.items() if s.get('is_live_tracking'))
+_lock = threading.Lock()
+
+# Serialized /api/locations body, rebuilt lazily after each write
+_LOCATIONS_JSON_CACHE = None
+_CACHE_VERSION = 0
+# Keeps ETags from one run from matching another run's data
+_CACHE_BOOT_ID = os.urandom(4).hex()
+
+# Rewrite both logs before appending: this migrates legacy files, trims an
+# oversized log and drops a torn tail record (msgpack can't resync past one)
+_write_log(LOCATIONS_LOG, map(_encode_record, _LOCATIONS))
+_write_log(SESSIONS_LOG, map(_encode_record, _SESSIONS.items()))
+
+_LOGS = {'locations': LOCATIONS_LOG, 'sessions': SESSIONS_LOG}
+_log_fps = {name: open(path, 'ab', buffering=0) for name, path in _LOGS.items()}
+_log_records = {'locations': len(_LOCATIONS), 'sessions': len(_SESSIONS)}
+
+# Pending disk writes, drained in batches by the persistence worker
+_write_queue = queue.Queue()
+
+def _write_all(fp, data):
+    """Write all of data to an unbuffered log, retrying short writes"""
+    offset = os.fstat(fp.fileno()).st_size
+    view = memoryview(data)
+    try:
+        while view:
+            view = view[fp.write(view):]
+    except Exception:
+        # msgpack can't resync past a torn record, so drop the partial write
+        os.ftruncate(fp.fileno(), offset)
+        raise
+
+def _snapshot(name):
+    """Copy the in-memory records backing a log (call with _lock held)"""
+    return list(_LOCATIONS) if name == 'locations' else list(_SESSIONS.items())
+
+def _persistence_worker():
+    """Drain queued writes, coalescing each burst into as few syscalls as possible"""
+    while True:
+        ops = [_write_queue.get()]
+        while True:
+            try:
+                ops.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        try:
+            pending = {name: [] for name in _LOGS}
+            for op, name, payload in ops:
+                if op == 'append':
+                    pending[name].append(payload)
+                elif op == 'compact':
+                    path = _LOGS[name]
+                    try:
+                        _write_log(path, map(_encode_record, payload))
+                    except Exception as e:
+                        # The old log is untouched; keep appending to it
+                        logger.error("❌ Error compacting %s log: %s", name, e)
+                        continue
+                    # Everything queued before the compaction is in its snapshot
+                    pending[name] = []
+                    old_fp, _log_fps[name] = _log_fps[name], open(path, 'ab', buffering=0)
+                    old_fp.close()
+            
+            for name, records in pending.items():
+                if records:
+                    try:
+                        _write_all(_log_fps[name], b''.join(records))
+                    except Exception as e:
+                        # Memory still has the lost records; rewrite the log from it
+                        logger.error("❌ Error writing %s log, rewriting it from memory: %s", name, e)
+                        with _lock:
+                            snapshot = _snapshot(name)
+                            _write_queue.put(('compact', name, snapshot))
+                            _log_records[name] = len(snapshot)
+        except Exception as e:
+            logger.error("❌ Error persisting data: %s", e)
+        finally:
+            for _ in ops:
+                _write_queue.task_done()
+
+def _queue_append(name, record, snapshot):
+    """Queue one encoded record, plus a compaction once the log grows too large (call with _lock held)"""
+    _write_queue.put(('append', name, record))
+    _log_records[name] += 1
+    
+    if _log_records[name] >= max(COMPACT_THRESHOLD, len(snapshot) * 2):
+        _write_queue.put(('compact', name, list(snapshot)))
+        _log_records[name] = len(snapshot)
+
+def flush_persistence():
+    """Block until all queued writes have reached disk"""
+    _write_queue.join()
+
+socketio.start_background_task(_persistence_worker)
+atexit.register(flush_persistence)
+
+# Pending Socket.IO broadcasts, sent one at a time so admins see updates in order
+_emit_queue = queue.Queue()
+
+def _broadcast_worker():
+    """Emit queued real-time updates to connected admin clients in arrival order"""
+    while True:
+        event, payload = _emit_queue.get()
+        try:
+            socketio.emit(event, payload, namespace='/')
+        except Exception as e:
+            logger.error("❌ Error broadcasting %s: %s", event, e)
+        finally:
+            _emit_queue.task_done()
+
+socketio.start_background_task(_broadcast_worker)
+
+def load_locations():
+    """Return a snapshot of the cached location data"""
+    with _lock:
+        return list(_LOCATIONS)
+
+def save_location(data):
+    """Save location data to memory and queue it for the msgpack log; returns (record, session count)"""
+    global _LOCATIONS_JSON_CACHE, _CACHE_VERSION
+    with _lock:
+        # Consecutive updates from one device usually repeat the same device_info
+        previous_device_info = _SESSIONS.get(data.get('session_id'), {}).get('device_info')
+        data = _compact_location(data, previous_device_info)
+        
+        # Encode before touching any state so an unserializable record is rejected whole
+        orjson.dumps(data)
+        record = _encode_record(data)
+        _LOCATIONS_JSON_CACHE = None
+        _CACHE_VERSION += 1
+        
+        # deque drops the oldest record silently, so release its counts first
+        if len(_LOCATIONS) == _LOCATIONS.maxlen:
+            evicted = _LOCATIONS[0]
+            _discount(_SESSION_COUNTS, evicted.get('session_id'))
+            if _location_ip(evicted):
+                _discount(_IP_COUNTS, _location_ip(evicted))
+        _LOCATIONS.append(data)
+        _SESSION_COUNTS[data.get('session_id')] += 1
+        session_count = _SESSION_COUNTS[data.get('session_id')]
+        if _location_ip(data):
+            _IP_COUNTS[_location_ip(data)] += 1
+        _queue_append('locations', record, _LOCATIONS)
+    
+    return data, session_count
+
+def load_sessions():
+    """Return a snapshot of the cached sessions"""
+    with _lock:
+        return dict(_SESSIONS)
+
+def save_session(session_id, data):
+    """Save session information to memory and queue it as an upsert in the msgpack log"""
+    # Encode before touching any state so an unserializable session is rejected whole
+    orjson.dumps(data)
+    record = _encode_record((session_id, data))
+    with _lock:
+        _SESSIONS[session_id] = data
+        if data.get('is_live_tracking'):
+            _LIVE_SESSIONS.add(session_id)
+        else:
+            _LIVE_SESSIONS.discard(session_id)
+        _queue_append('sessions', record, _SESSIONS.items())
+
+# Loopback addresses allowed to reach admin endpoints (incl. IPv4-mapped IPv6)
+LOCALHOSTS = frozenset({'127.0.0.1', 'localhost', '::1', '::ffff:127.0.0.1'})
+
+# (epoch second, ISO prefix) of the last formatted timestamp
+_iso_cache = (None, None)
+
+def fast_iso():
+    """Local ISO-8601 timestamp, reusing the formatted prefix within a second"""
+    global _iso_cache
+    ns = time.time_ns()
+    sec = ns // 1_000_000_000
+    cached_sec, prefix = _iso_cache
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec).isoformat()
+        _iso_cache = (sec, prefix)
+    return f"{prefix}.{(ns % 1_000_000_000) // 1000:06d}"
+
+# Random IDs are generated in batches to avoid one urandom call per UUID
+UUID_POOL_SIZE = 256
+_UUID_POOL = deque()
+_UUID_LOCK = threading.Lock()
+
+def _next_uuid():
+    """Return a random UUID4 string from the pre-generated pool"""
+    while True:
+        try:
+            return _UUID_POOL.popleft()
+        except IndexError:
+            with _UUID_LOCK:
+                if not _UUID_POOL:
+                    buf = os.urandom(16 * UUID_POOL_SIZE)
+                    _UUID_POOL.extend(str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, len(buf), 16))
+
+def orjson_response(obj, status=200):
+    """Build a JSON response serialized with orjson"""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
 
 def is_localhost(request):
     """Check if request is from localhost"""
-    remote_addr = request.remote_addr
-    allowed_hosts = ['127.0.0.1', 'localhost', '::1']
-    return remote_addr in allowed_hosts
+    return request.remote_addr in LOCALHOSTS
 
 @app.route('/')
 def index():
@@ -95,13 +385,22 @@ def receive_location():
     try:
         data = request.get_json()
         
-        # Generate or use existing session ID
-        session_id = data.get('session_id') or str(uuid.uuid4())
+        # Generate or use existing session ID; it becomes a dict key, so it must be a string
+        session_id = data.get('session_id')
+        if session_id is None:
+            session_id = _next_uuid()
+        elif not isinstance(session_id, str) or not session_id:
+            return orjson_response({
+                'status': 'error',
+                'message': 'session_id must be a non-empty string'
+            }, 400)
+        
+        now = fast_iso()
         
         # Extract comprehensive location and device data
         location_data = {
-            'id': str(uuid.uuid4()),
-            'timestamp': datetime.now().isoformat(),
+            'id': _next_uuid(),
+            'timestamp': now,
             'latitude': data.get('latitude'),
             'longitude': data.get('longitude'),
             'accuracy': data.get('accuracy'),
@@ -144,57 +443,53 @@ def receive_location():
         }
         
         # Save to file
-        saved_data = save_location(location_data)
+        saved_data, location_count = save_location(location_data)
         
         # Update session info
         session_info = {
             'session_id': session_id,
-            'first_seen': data.get('first_seen', datetime.now().isoformat()),
-            'last_seen': datetime.now().isoformat(),
-            'location_count': len([loc for loc in load_locations() if loc.get('session_id') == session_id]),
-            'device_info': location_data['device_info'],
+            'first_seen': data['first_seen'] if isinstance(data.get('first_seen'), str) else now,
+            'last_seen': now,
+            'location_count': location_count,
+            'device_info': saved_data['device_info'],
             'is_live_tracking': data.get('is_live', False)
         }
         save_session(session_id, session_info)
         
-        # Broadcast real-time update to all connected admin clients via Socket.IO
-        socketio.emit('location_update', {
+        # Broadcast real-time update to all connected admin clients via Socket.IO,
+        # off the request thread so the response doesn't wait on the fan-out
+        _emit_queue.put(('location_update', {
             'location': location_data,
             'session': session_info
-        }, namespace='/')
-        
-        # Enhanced console logging
-        live_indicator = "🔴 LIVE" if location_data['is_live'] else "📍"
-        print(f"\n{'='*70}")
-        print(f"{live_indicator} UNQTRAKER - LOCATION UPDATE")
-        print(f"{'='*70}")
-        print(f"🆔 Session: {session_id[:8]}...")
-        print(f"⏰ Time: {location_data['timestamp']}")
-        print(f"🌍 Location: {location_data['latitude']:.6f}, {location_data['longitude']:.6f}")
-        print(f"🎯 Accuracy: {location_data['accuracy']}m")
-        print(f"📱 Device: {location_data['device_info']['device_type']} - {location_data['device_info']['os']}")
-        print(f"💻 Browser: {location_data['device_info']['browser']} {location_data['device_info']['browser_version']}")
-        print(f"📶 IP: {location_data['device_info']['ip_address']}")
-        
-        if location_data['device_info']['battery_level']:
-            print(f"🔋 Battery: {location_data['device_info']['battery_level']}% {'⚡' if location_data['device_info']['battery_charging'] else '🪫'}")
+        }))
         
-        print(f"🗺️  Maps: https://www.google.com/maps?q={location_data['latitude']},{location_data['longitude']}")
-        print(f"{'='*70}\n")
+        # Single console line per update; formatted only if INFO is enabled
+        device_info = location_data['device_info']
+        logger.info(
+            "%s session=%s time=%s loc=%s,%s acc=%sm device=%s/%s browser=%s %s ip=%s battery=%s%s maps=https://www.google.com/maps?q=%s,%s",
+            "🔴 LIVE" if location_data['is_live'] else "📍",
+            session_id[:8], location_data['timestamp'],
+            location_data['latitude'], location_data['longitude'], location_data['accuracy'],
+            device_info['device_type'], device_info['os'],
+            device_info['browser'], device_info['browser_version'],
+            device_info['ip_address'],
+            device_info['battery_level'], '⚡' if device_info['battery_charging'] else '',
+            location_data['latitude'], location_data['longitude']
+        )
         
-        return jsonify({
+        return orjson_response({
             'status': 'success',
             'message': 'Location tracked successfully',
             'session_id': session_id,
             'data': saved_data
-        }), 200
+        }, 200)
         
     except Exception as e:
-        print(f"❌ Error receiving location: {str(e)}")
-        return jsonify({
+        logger.error("❌ Error receiving location: %s", e)
+        return orjson_response({
             'status': 'error',
             'message': str(e)
-        }), 400
+        }, 400)
 
 @app.route('/api/locations', methods=['GET'])
 def get_locations():
@@ -202,17 +497,32 @@ def get_locations():
     if not is_localhost(request):
         abort(403)
     
+    global _LOCATIONS_JSON_CACHE
     session_id = request.args.get('session_id')
-    locations = load_locations()
     
     if session_id:
-        locations = [loc for loc in locations if loc.get('session_id') == session_id]
+        with _lock:
+            locations = [loc for loc in _LOCATIONS if loc.get('session_id') == session_id]
+        return orjson_response({
+            'status': 'success',
+            'count': len(locations),
+            'locations': locations
+        })
     
-    return jsonify({
-        'status': 'success',
-        'count': len(locations),
-        'locations': locations
-    })
+    # Unfiltered polls reuse the serialized body until the next save_location
+    with _lock:
+        if _LOCATIONS_JSON_CACHE is None:
+            _LOCATIONS_JSON_CACHE = orjson.dumps({
+                'status': 'success',
+                'count': len(_LOCATIONS),
+                'locations': list(_LOCATIONS)
+            })
+        body = _LOCATIONS_JSON_CACHE
+        version = _CACHE_VERSION
+    
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(f'{_CACHE_BOOT_ID}-{version}', weak=True)
+    return response.make_conditional(request)
 
 @app.route('/api/sessions', methods=['GET'])
 def get_sessions():
@@ -221,28 +531,34 @@ def get_sessions():
         abort(403)
     
     sessions = load_sessions()
-    return jsonify({
+    return orjson_response({
         'status': 'success',
         'count': len(sessions),
         'sessions': sessions
     })
 
+# Constant parts of the /api/latest and /api/stats bodies, pre-serialized
+_LATEST_PREFIX = b'{"status":"success","location":'
+_LATEST_NOT_FOUND = orjson.dumps({'status': 'error', 'message': 'No locations found'})
+_STATS_EMPTY = orjson.dumps({
+    'status': 'success',
+    'total_locations': 0,
+    'total_sessions': 0,
+    'unique_ips': 0,
+    'active_sessions': 0
+})
+_STATS_TEMPLATE = b'{"status":"success","total_locations":%d,"total_sessions":%d,"unique_ips":%d,"active_sessions":%d,"latest_timestamp":%s}'
+
 @app.route('/api/latest', methods=['GET'])
 def get_latest():
     """API endpoint to get the latest location - localhost only"""
     if not is_localhost(request):
         abort(403)
         
-    locations = load_locations()
-    if locations:
-        return jsonify({
-            'status': 'success',
-            'location': locations[-1]
-        })
-    return jsonify({
-        'status': 'error',
-        'message': 'No locations found'
-    }), 404
+    if _LOCATIONS:
+        body = _LATEST_PREFIX + orjson.dumps(_LOCATIONS[-1]) + b'}'
+        return app.response_class(body, mimetype='application/json')
+    return app.response_class(_LATEST_NOT_FOUND, status=404, mimetype='application/json')
 
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
@@ -250,61 +566,43 @@ def get_stats():
     if not is_localhost(request):
         abort(403)
         
-    locations = load_locations()
-    sessions = load_sessions()
-    
-    if not locations:
-        return jsonify({
-            'status': 'success',
-            'total_locations': 0,
-            'total_sessions': 0,
-            'unique_ips': 0,
-            'active_sessions': 0
-        })
+    if not _LOCATIONS:
+        return app.response_class(_STATS_EMPTY, mimetype='application/json')
     
-    unique_ips = len(set(loc['device_info']['ip_address'] for loc in locations if loc.get('device_info', {}).get('ip_address')))
-    active_sessions = len([s for s in sessions.values() if s.get('is_live_tracking')])
-    
-    return jsonify({
-        'status': 'success',
-        'total_locations': len(locations),
-        'total_sessions': len(sessions),
-        'unique_ips': unique_ips,
-        'active_sessions': active_sessions,
-        'latest_timestamp': locations[-1]['timestamp'] if locations else None
-    })
+    body = _STATS_TEMPLATE % (
+        len(_LOCATIONS), len(_SESSIONS), len(_IP_COUNTS), len(_LIVE_SESSIONS),
+        orjson.dumps(_LOCATIONS[-1]['timestamp'])
+    )
+    return app.response_class(body, mimetype='application/json')
+
+# Constant parts of the /health body, pre-serialized around the live fields
+_HEALTH_PREFIX = b'{"status":"healthy","app":"UnQTraker","version":"3.0","timestamp":"'
+_HEALTH_SUFFIX = b'","total_locations":%d,"active_sessions":%d,"developer":"Sandeep Gaddam"}'
 
 @app.route('/health')
 def health():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'app': 'UnQTraker',
-        'version': '3.0',
-        'timestamp': datetime.now().isoformat(),
-        'total_locations': len(load_locations()),
-        'active_sessions': len(load_sessions()),
-        'developer': 'Sandeep Gaddam'
-    })
+    body = _HEALTH_PREFIX + fast_iso().encode() + _HEALTH_SUFFIX % (len(_LOCATIONS), len(_SESSIONS))
+    return app.response_class(body, mimetype='application/json')
 
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection"""
-    print(f"✅ Admin connected: {request.sid}")
+    logger.info("✅ Admin connected: %s", request.sid)
     emit('connection_status', {'status': 'connected', 'message': 'Real-time tracking active'})
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
-    print(f"❌ Admin disconnected: {request.sid}")
+    logger.info("❌ Admin disconnected: %s", request.sid)
 
 @app.errorhandler(403)
 def forbidden(e):
     """Custom 403 error handler"""
-    return jsonify({
+    return orjson_response({
         'error': 'Access Denied',
         'message': 'This resource is only accessible from localhost'
-    }), 403
+    }, 403)
 
 if __name__ == '__main__':
     print("\n" + "="*70)
@@ -330,4 +628,6 @@ if __name__ == '__main__':
     print("👨‍💻 Built with ❤️ by Sandeep Gaddam")
     print("="*70 + "\n")
     
-    socketio.run(app, host='0.0.0.0', port=5000, debug=True, allow_unsafe_werkzeug=True)
\ No newline at end of file
+    # Development server only; production runs under gunicorn (see start.sh)
+    debug = os.environ.get('UNQTRAKER_DEBUG', '0') == '1'
+    socketio.run(app, host='0.0.0.0', port=5000, debug=debug, allow_unsafe_werkzeug=True)
\ No newline at end of file
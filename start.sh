@@ -62,8 +62,10 @@ if ! command -v cloudflared &> /dev/null; then
 fi
 
 # Start Flask app in background
+# One gunicorn worker keeps the in-memory store and data logs single-writer;
+# threads serve concurrent HTTP and Socket.IO clients
 echo -e "${BLUE}🌐 Starting Flask server...${NC}"
-python app.py > flask.log 2>&1 &
+gunicorn --workers 1 --threads 100 --bind 0.0.0.0:5000 app:app > flask.log 2>&1 &
 FLASK_PID=$!
 
 # Wait for Flask to start